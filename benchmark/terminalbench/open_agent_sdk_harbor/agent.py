@@ -14,8 +14,10 @@ Usage:
     harbor run -d terminal-bench@2.0 --agent-import-path "harbor.agents.installed.open_agent_sdk:OpenAgentSDKAgent" --model MiniMax-M2.5
 """
 
+import functools
 import os
 from pathlib import Path
+from typing import ClassVar
 
 from harbor.agents.installed.base import BaseInstalledAgent, ExecInput
 from harbor.models.agent.context import AgentContext
@@ -24,29 +26,69 @@ from harbor.models.agent.context import AgentContext
 # CLI command (installed globally by install script)
 CLI_COMMAND = "oas"
 
+# Flags passed on every run (always use /workspace as cwd for Harbor compatibility)
+_STATIC_FLAGS = "--cwd /workspace --output-format json"
 
+# MiniMax uses the anthropic provider with a custom base URL, which is
+# exported into the shell alongside the other env vars
+_MINIMAX_PREFIX = '--provider anthropic --base-url "$ANTHROPIC_BASE_URL"'
+
+# Install script template rendered by Harbor inside the container
+_INSTALL_TEMPLATE_PATH = Path(__file__).parent / "install-open-agent-sdk.sh.j2"
+
+# Escapes applied to the instruction before embedding it in a double-quoted
+# shell argument
+_SHELL_ESCAPE = str.maketrans({'"': '\\"', '$': '\\$'})
+
+# Standard providers: (model name prefix, provider label, API key env var).
+# Checked in order against the lowercased model name.
+_PROVIDER_TABLE = (
+    ("gemini", "Gemini", "GEMINI_API_KEY"),
+    ("google", "Gemini", "GEMINI_API_KEY"),
+    ("claude", "Claude", "ANTHROPIC_API_KEY"),
+    ("gpt", "OpenAI", "OPENAI_API_KEY"),
+    ("openai", "OpenAI", "OPENAI_API_KEY"),
+)
+
+
+@functools.lru_cache(maxsize=128)
 def is_minimax_model(model_name: str) -> bool:
     """Check if the model is a MiniMax model."""
     return model_name.lower().startswith("minimax")
 
 
-def get_required_env_vars(model_name: str) -> dict[str, str]:
+def get_required_env_vars(
+    model_name: str, minimax_auth_env_var: str = "ANTHROPIC_API_KEY"
+) -> dict[str, str]:
     """
     Determine required environment variables based on model name.
     Returns a dict of {env_var_name: env_var_value}.
+
+    `minimax_auth_env_var` names the credential sent to the MiniMax
+    Anthropic-compatible endpoint.
+
+    The environment is read once per model name and cached for the lifetime
+    of the process; callers get a fresh copy they are free to mutate.
     """
-    env_vars = {}
+    return dict(_resolve_env_vars(model_name, minimax_auth_env_var))
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_env_vars(
+    model_name: str, minimax_auth_env_var: str
+) -> tuple[tuple[str, str], ...]:
+    """Read the provider env vars for `model_name` (cached, see above)."""
     model_lower = model_name.lower()
 
     # MiniMax uses Anthropic compatible endpoint
     # SDK auto-detects Bearer auth based on baseURL
-    if is_minimax_model(model_name):
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if is_minimax_model(model_lower):
+        api_key = os.environ.get(minimax_auth_env_var)
         base_url = os.environ.get("ANTHROPIC_BASE_URL")
 
         if not api_key:
             raise ValueError(
-                "MiniMax model requires ANTHROPIC_API_KEY environment variable."
+                f"MiniMax model requires {minimax_auth_env_var} environment variable."
             )
         if not base_url:
             raise ValueError(
@@ -55,34 +97,21 @@ def get_required_env_vars(model_name: str) -> dict[str, str]:
             )
 
         # SDK will auto-detect Bearer auth based on baseURL
-        env_vars["ANTHROPIC_API_KEY"] = api_key
-        env_vars["ANTHROPIC_BASE_URL"] = base_url
-        return env_vars
+        return ((minimax_auth_env_var, api_key), ("ANTHROPIC_BASE_URL", base_url))
 
     # Standard providers
-    if model_lower.startswith("gemini") or model_lower.startswith("google"):
-        api_key = os.environ.get("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("Gemini model requires GEMINI_API_KEY environment variable.")
-        env_vars["GEMINI_API_KEY"] = api_key
-    elif model_lower.startswith("claude"):
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("Claude model requires ANTHROPIC_API_KEY environment variable.")
-        env_vars["ANTHROPIC_API_KEY"] = api_key
-    elif model_lower.startswith("gpt") or model_lower.startswith("openai"):
-        api_key = os.environ.get("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OpenAI model requires OPENAI_API_KEY environment variable.")
-        env_vars["OPENAI_API_KEY"] = api_key
-    else:
-        # Default to Gemini for unknown models
-        api_key = os.environ.get("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError(f"Unknown model '{model_name}'. Please set GEMINI_API_KEY for default Gemini provider.")
-        env_vars["GEMINI_API_KEY"] = api_key
+    for prefix, provider, env_var in _PROVIDER_TABLE:
+        if model_lower.startswith(prefix):
+            api_key = os.environ.get(env_var)
+            if not api_key:
+                raise ValueError(f"{provider} model requires {env_var} environment variable.")
+            return ((env_var, api_key),)
 
-    return env_vars
+    # Default to Gemini for unknown models
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        raise ValueError(f"Unknown model '{model_name}'. Please set GEMINI_API_KEY for default Gemini provider.")
+    return (("GEMINI_API_KEY", api_key),)
 
 
 class OpenAgentSDKAgent(BaseInstalledAgent):
@@ -91,6 +120,12 @@ class OpenAgentSDKAgent(BaseInstalledAgent):
     Calls the `oas` CLI in headless mode (-p flag).
     """
 
+    # Model used when Harbor is run without --model
+    DEFAULT_MODEL: ClassVar[str] = "gemini-2.0-flash"
+
+    # Credential env var forwarded for MiniMax models
+    MINIMAX_AUTH_ENV_VAR: ClassVar[str] = "ANTHROPIC_API_KEY"
+
     @staticmethod
     def name() -> str:
         return "open-agent-sdk"
@@ -101,37 +136,32 @@ class OpenAgentSDKAgent(BaseInstalledAgent):
     @property
     def _install_agent_template_path(self) -> Path:
         """Path to the install script template."""
-        return Path(__file__).parent / "install-open-agent-sdk.sh.j2"
+        return _INSTALL_TEMPLATE_PATH
 
     def create_run_agent_commands(self, instruction: str) -> list[ExecInput]:
-        model = self.model_name or "gemini-2.0-flash"
+        model = self.model_name or self.DEFAULT_MODEL
+
+        is_mm = is_minimax_model(model)
 
         # Get required environment variables
-        env_vars = get_required_env_vars(model)
+        env_vars = get_required_env_vars(model, self.MINIMAX_AUTH_ENV_VAR)
 
         # Escape instruction for shell
-        escaped = instruction.replace('"', '\\"').replace('$', '\\$')
+        escaped = instruction.translate(_SHELL_ESCAPE)
 
         # Build CLI command with env vars inline (for Daytona compatibility)
         # Daytona uses shlex.quote on env values which breaks shell variable assignment
-        env_exports = " && ".join([f'export {k}="{v}"' for k, v in env_vars.items()])
-
-        # Build base command (always use /workspace as cwd for Harbor compatibility)
-        cmd_parts = [
-            'export PATH="$HOME/.bun/bin:$PATH"',
-            env_exports,
-            f'{CLI_COMMAND} -p "{escaped}" --model {model} --cwd /workspace --output-format json'
-        ]
+        env_exports = " && ".join(f'export {k}="{v}"' for k, v in env_vars.items())
 
-        # For MiniMax, add --provider and --base-url flags
-        if is_minimax_model(model) and "ANTHROPIC_BASE_URL" in env_vars:
-            base_url = env_vars["ANTHROPIC_BASE_URL"]
-            # Use anthropic provider with custom base URL
-            cmd_parts[2] = f'{CLI_COMMAND} --provider anthropic --base-url {base_url} -p "{escaped}" --model {model} --cwd /workspace --output-format json'
+        # Build oas invocation
+        cli_flags = f"--model {model} {_STATIC_FLAGS}"
+        if is_mm:
+            cli_flags = _MINIMAX_PREFIX + " " + cli_flags
+        cli_cmd = f'{CLI_COMMAND} -p "{escaped}" {cli_flags}'
 
         return [
             ExecInput(
-                command=" && ".join(cmd_parts),
+                command=f'export PATH="$HOME/.bun/bin:$PATH" && {env_exports} && {cli_cmd}',
                 timeout_sec=600,
             )
         ]
@@ -83,14 +83,20 @@ echo ""
 echo "Registering local development agent..."
 
 HARBOR_AGENTS_DIR=$(python -c "import harbor; print(harbor.__path__[0])")/agents/installed
-AGENT_SOURCE="$REPO_ROOT/benchmark/terminalbench/harbor/agent_local.py"
+ADAPTER_DIR="$REPO_ROOT/benchmark/terminalbench/open_agent_sdk_harbor"
+BASE_AGENT_SOURCE="$ADAPTER_DIR/agent.py"
+BASE_AGENT_TARGET="$HARBOR_AGENTS_DIR/open_agent_sdk.py"
+AGENT_SOURCE="$ADAPTER_DIR/agent_local.py"
 AGENT_TARGET="$HARBOR_AGENTS_DIR/open_agent_sdk_local.py"
-TEMPLATE_SOURCE="$REPO_ROOT/benchmark/terminalbench/harbor/install-open-agent-sdk-local.sh.j2"
+TEMPLATE_SOURCE="$ADAPTER_DIR/install-open-agent-sdk-local.sh.j2"
 TEMPLATE_TARGET="$HARBOR_AGENTS_DIR/install-open-agent-sdk-local.sh.j2"
 
-# Create symlinks for both agent and template
+# Create symlinks for the agents and template
+# (agent_local.py subclasses the base adapter from open_agent_sdk.py)
+ln -sf "$BASE_AGENT_SOURCE" "$BASE_AGENT_TARGET"
 ln -sf "$AGENT_SOURCE" "$AGENT_TARGET"
 ln -sf "$TEMPLATE_SOURCE" "$TEMPLATE_TARGET"
+print_status "Base agent registered at $BASE_AGENT_TARGET"
 print_status "Agent registered at $AGENT_TARGET"
 print_status "Template registered at $TEMPLATE_TARGET"
 